@@ -0,0 +1,118 @@
+/*
+ * Copyright (c) 2023, NVIDIA CORPORATION.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include <cuda_bf16.h>
+
+#include "common/check.h"
+#include "variable/impl/cuembed_gather.h"
+
+namespace sok {
+
+// Each thread copies `kLoadsPerThread` vectors(VecT covers 4 elements) per
+// grid-stride step. The row pointers and the row data are loaded through
+// __ldg and the loop is fully unrolled, so the loads of one step are all
+// issued before any of them is consumed, which keeps kLoadsPerThread loads
+// in flight per thread.
+// When kVecsPerRow != 0 the row width is a compile-time constant: the
+// per-item division/modulo below fold into shifts and the copy loop is
+// fully unrolled for that width.
+template <typename ElemT, typename VecT, int kLoadsPerThread, uint32_t kVecsPerRow = 0>
+__global__ static void GatherVecKernel(const ElemT *const *rows, VecT *values, size_t num_keys,
+                                       uint32_t dyn_vecs_per_row) {
+  const uint32_t vecs_per_row = kVecsPerRow != 0 ? kVecsPerRow : dyn_vecs_per_row;
+  size_t thread_cnt = blockDim.x * gridDim.x;
+  size_t thread_idx = blockDim.x * blockIdx.x + threadIdx.x;
+  size_t items = num_keys * vecs_per_row;
+
+  size_t step = thread_cnt * kLoadsPerThread;
+  for (size_t i = thread_idx * kLoadsPerThread; i < items; i += step) {
+    const VecT *src[kLoadsPerThread];
+    VecT data[kLoadsPerThread];
+
+#pragma unroll
+    for (int j = 0; j < kLoadsPerThread; ++j) {
+      size_t item = i + j;
+      if (item < items) {
+        const ElemT *row = __ldg(rows + item / vecs_per_row);
+        src[j] = reinterpret_cast<const VecT *>(row) + item % vecs_per_row;
+      }
+    }
+#pragma unroll
+    for (int j = 0; j < kLoadsPerThread; ++j) {
+      if (i + j < items) {
+        data[j] = __ldg(src[j]);
+      }
+    }
+#pragma unroll
+    for (int j = 0; j < kLoadsPerThread; ++j) {
+      if (i + j < items) {
+        values[i + j] = data[j];
+      }
+    }
+  }
+}
+
+template <typename ElemT, typename VecT>
+static void LaunchGatherVecKernel(const ElemT *const *rows, ElemT *values, size_t num_keys,
+                                  int64_t dimension, cudaStream_t stream) {
+  if (num_keys == 0) {
+    return;
+  }
+
+  int device, sm_count;
+  CUDACHECK(cudaGetDevice(&device));
+  CUDACHECK(cudaDeviceGetAttribute(&sm_count, cudaDevAttrMultiProcessorCount, device));
+
+  uint32_t vecs_per_row = dimension / 4;
+  VecT *vec_values = reinterpret_cast<VecT *>(values);
+  // Specialize for the common embedding widths so the index math and the
+  // copy loop are evaluated at compile time; other widths take the generic
+  // kernel with a runtime row width.
+  switch (dimension) {
+#define GATHER_VEC_FIXED_DIM(dim)                                           \
+  case dim:                                                                 \
+    GatherVecKernel<ElemT, VecT, 4, dim / 4><<<2 * sm_count, 1024ul, 0, stream>>>( \
+        rows, vec_values, num_keys, vecs_per_row);                          \
+    break
+    GATHER_VEC_FIXED_DIM(8);
+    GATHER_VEC_FIXED_DIM(16);
+    GATHER_VEC_FIXED_DIM(32);
+    GATHER_VEC_FIXED_DIM(64);
+    GATHER_VEC_FIXED_DIM(128);
+#undef GATHER_VEC_FIXED_DIM
+    default:
+      GatherVecKernel<ElemT, VecT, 4><<<2 * sm_count, 1024ul, 0, stream>>>(
+          rows, vec_values, num_keys, vecs_per_row);
+      break;
+  }
+  CUDACHECK(cudaGetLastError());
+}
+
+template <>
+void CuEmbedGather(const float *const *rows, float *values, size_t num_keys, int64_t dimension,
+                   cudaStream_t stream) {
+  // 4 floats -> one 16-byte float4 load
+  LaunchGatherVecKernel<float, float4>(rows, values, num_keys, dimension, stream);
+}
+
+template <>
+void CuEmbedGather(const __nv_bfloat16 *const *rows, __nv_bfloat16 *values, size_t num_keys,
+                   int64_t dimension, cudaStream_t stream) {
+  // 4 bfloat16 -> one 8-byte uint2 load
+  LaunchGatherVecKernel<__nv_bfloat16, uint2>(rows, values, num_keys, dimension, stream);
+}
+
+}  // namespace sok
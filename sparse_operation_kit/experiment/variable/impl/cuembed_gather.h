@@ -0,0 +1,38 @@
+/*
+ * Copyright (c) 2023, NVIDIA CORPORATION.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#ifndef CUEMBED_GATHER_H
+#define CUEMBED_GATHER_H
+
+#include <cuda_runtime_api.h>
+
+namespace sok {
+
+// Gathers the rows addressed by `rows` into the contiguous [num_keys, dimension]
+// buffer `values`.
+//
+// The embedding lookup is memory-bound, so this kernel is modeled on cuEmbed's
+// embedding_forward: every thread issues several vectorized(float4) loads
+// back-to-back to keep a high number of loads in flight and saturate HBM
+// bandwidth. It requires dimension % 4 == 0, the caller is responsible for
+// falling back to the scalar path otherwise.
+template <typename ValueType>
+void CuEmbedGather(const ValueType *const *rows, ValueType *values, size_t num_keys,
+                   int64_t dimension, cudaStream_t stream);
+
+}  // namespace sok
+
+#endif  // CUEMBED_GATHER_H
@@ -14,6 +14,8 @@
  * limitations under the License.
  */
 
+#include <cuda_bf16.h>
+
 #include <random>
 
 #include "common/check.h"
@@ -128,23 +130,39 @@ void DETVariable<KeyType, ValueType>::eXport(KeyType* keys, ValueType* values,
   size_t num_keys = rows();
   size_t dim = cols();
 
-  // `keys` and `values` are pointers of host memory
-  KeyType* d_keys;
-  CUDACHECK(cudaMalloc(&d_keys, sizeof(KeyType) * num_keys));
-  ValueType* d_values;
-  CUDACHECK(cudaMalloc(&d_values, sizeof(ValueType) * num_keys * dim));
+  // `keys` and `values` are pointers of host memory.
+  // Stage both sections in one SoA blob so only a single (synchronizing)
+  // cudaMalloc/cudaFree pair is paid per export. The values section is kept
+  // 16-byte aligned.
+  size_t keys_bytes = sizeof(KeyType) * num_keys;
+  size_t values_offset = (keys_bytes + 15) / 16 * 16;
+  char* d_buffer;
+  CUDACHECK(cudaMalloc(&d_buffer, values_offset + sizeof(ValueType) * num_keys * dim));
+  KeyType* d_keys = reinterpret_cast<KeyType*>(d_buffer);
+  ValueType* d_values = reinterpret_cast<ValueType*>(d_buffer + values_offset);
 
   map_->eXport(d_keys, d_values, num_keys, stream);
 
+  // `keys` and `values` are pinned, so the two copies are real DMAs and can
+  // run concurrently: the keys go out on a side stream while the values go
+  // out on `stream`.
+  cudaStream_t keys_stream;
+  CUDACHECK(cudaStreamCreateWithFlags(&keys_stream, cudaStreamNonBlocking));
+  cudaEvent_t export_done;
+  CUDACHECK(cudaEventCreateWithFlags(&export_done, cudaEventDisableTiming));
+  CUDACHECK(cudaEventRecord(export_done, stream));
+  CUDACHECK(cudaStreamWaitEvent(keys_stream, export_done));
   // clang-format off
   CUDACHECK(cudaMemcpyAsync(keys, d_keys, sizeof(KeyType) * num_keys,
-                            cudaMemcpyDeviceToHost, stream));
+                            cudaMemcpyDeviceToHost, keys_stream));
   CUDACHECK(cudaMemcpyAsync(values, d_values, sizeof(ValueType) * num_keys * dim,
                             cudaMemcpyDeviceToHost, stream));
   // clang-format on
+  CUDACHECK(cudaStreamSynchronize(keys_stream));
   CUDACHECK(cudaStreamSynchronize(stream));
-  CUDACHECK(cudaFree(d_keys));
-  CUDACHECK(cudaFree(d_values));
+  CUDACHECK(cudaEventDestroy(export_done));
+  CUDACHECK(cudaStreamDestroy(keys_stream));
+  CUDACHECK(cudaFree(d_buffer));
 }
 
 template <typename KeyType, typename ValueType>
@@ -190,6 +208,14 @@ void DETVariable<KeyType, ValueType>::scatter_add(const KeyType* keys, const Val
   map_->scatter_add(keys, values, num_keys, stream);
 }
 
+template <typename KeyType, typename ValueType>
+void DETVariable<KeyType, ValueType>::scatter_sub(const KeyType* keys, const ValueType* values,
+                                                  size_t num_keys, cudaStream_t stream) {
+  // The negation happens at register level in the scatter kernel, so no
+  // negated copy of `values` is needed.
+  map_->template scatter_add<true>(keys, values, num_keys, stream);
+}
+
 template <typename KeyType, typename ValueType>
 void DETVariable<KeyType, ValueType>::scatter_update(const KeyType* keys, const ValueType* values,
                                                      size_t num_keys, cudaStream_t stream) {
@@ -198,5 +224,7 @@ void DETVariable<KeyType, ValueType>::scatter_update(const KeyType* keys, const
 
 template class DETVariable<int32_t, float>;
 template class DETVariable<int64_t, float>;
+template class DETVariable<int32_t, __nv_bfloat16>;
+template class DETVariable<int64_t, __nv_bfloat16>;
 
 }  // namespace sok
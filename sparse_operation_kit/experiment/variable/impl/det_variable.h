@@ -45,6 +45,8 @@ class DETVariable : public VariableBase<KeyType, ValueType> {
               cudaStream_t stream = 0) override;
   void scatter_add(const KeyType *keys, const ValueType *values, size_t num_keys,
                    cudaStream_t stream = 0) override;
+  void scatter_sub(const KeyType *keys, const ValueType *values, size_t num_keys,
+                   cudaStream_t stream = 0) override;
   void scatter_update(const KeyType *keys, const ValueType *values, size_t num_keys,
                       cudaStream_t stream = 0) override;
 
@@ -171,7 +171,7 @@ void dynamic_map<Key, Element, Initializer>::lookup(key_type const *keys, elemen
 }
 
 template <typename Key, typename Element, typename Initializer>
-template <typename Hash>
+template <bool Negate, typename Hash>
 void dynamic_map<Key, Element, Initializer>::scatter_add(key_type const *keys,
                                                          element_type const *updates,
                                                          size_t num_keys, cudaStream_t stream,
@@ -181,7 +181,7 @@ void dynamic_map<Key, Element, Initializer>::scatter_add(key_type const *keys,
   auto const tile_size = 4;
   auto const grid_size = (tile_size * num_keys + stride * block_size - 1) / (stride * block_size);
 
-  detail::scatter_add<tile_size, const_pair_type><<<grid_size, block_size, 0, stream>>>(
+  detail::scatter_add<tile_size, const_pair_type, Negate><<<grid_size, block_size, 0, stream>>>(
       keys, updates, dimension_, num_keys, submap_mutable_views_.data().get(), submaps_.size(),
       hash);
 }
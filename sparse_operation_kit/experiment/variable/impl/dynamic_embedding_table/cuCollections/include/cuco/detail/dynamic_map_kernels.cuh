@@ -139,8 +139,8 @@ __global__ void lookup(key_type const *keys, element_type **values, uint32_t dim
   }
 }
 
-template <uint32_t tile_size, typename pair_type, typename key_type, typename element_type,
-          typename mutableViewT, typename Hash>
+template <uint32_t tile_size, typename pair_type, bool Negate, typename key_type,
+          typename element_type, typename mutableViewT, typename Hash>
 __global__ void scatter_add(key_type const *keys, element_type const *updates, uint32_t dimension,
                             size_t num_keys, mutableViewT *submap_mutable_views,
                             uint32_t num_submaps, Hash hash) {
@@ -154,7 +154,7 @@ __global__ void scatter_add(key_type const *keys, element_type const *updates, u
 
     for (auto i = 0; i < num_submaps; ++i) {
       auto submap_view = submap_mutable_views[i];
-      if (submap_view.add(tile, add_pair, hash)) {
+      if (submap_view.template add<Negate>(tile, add_pair, hash)) {
         break;
       }
     }
@@ -32,7 +32,19 @@ class lock {
   __device__ void acquire(CG const &g, unsigned long long lane) const {
     if (g.thread_rank() == lane) {
       int expected = 1;
+      unsigned backoff_ns = 8;
       while (!_lock.compare_exchange_weak(expected, 2, cuda::std::memory_order_acquire)) {
+        // Test-and-test-and-set: spin on a relaxed load with exponential
+        // backoff instead of hammering the line with CAS traffic, so the
+        // holder's release gets through sooner on contended rows.
+        do {
+#if defined(__CUDA_ARCH__) && __CUDA_ARCH__ >= 700
+          __nanosleep(backoff_ns);
+          if (backoff_ns < 256) {
+            backoff_ns *= 2;
+          }
+#endif
+        } while (_lock.load(cuda::std::memory_order_relaxed) != 1);
         expected = 1;
       }
     }
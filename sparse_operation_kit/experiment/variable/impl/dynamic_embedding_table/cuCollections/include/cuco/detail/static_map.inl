@@ -220,7 +220,7 @@ static_map<Key, Element, Initializer>::device_mutable_view::lookup_or_insert(
 }
 
 template <typename Key, typename Element, typename Initializer>
-template <typename CG, typename Hash>
+template <bool Negate, typename CG, typename Hash>
 __device__ bool static_map<Key, Element, Initializer>::device_mutable_view::add(
     CG g, const_pair_type const &add_pair, Hash hash) noexcept {
   auto current_slot = initial_slot(g, add_pair.first, hash);
@@ -235,7 +235,7 @@ __device__ bool static_map<Key, Element, Initializer>::device_mutable_view::add(
       auto const src_lane = __ffs(exists) - 1;
       auto const value = g.shfl(current_slot.value(), src_lane);
       current_slot.lock().acquire(g, src_lane);
-      detail::accumulate_array(g, this->get_dimension(), value, add_pair.second);
+      detail::accumulate_array<Negate>(g, this->get_dimension(), value, add_pair.second);
       current_slot.lock().release(g, src_lane);
       return true;
     }
@@ -16,6 +16,8 @@
 
 #pragma once
 
+#include <cuda_bf16.h>
+
 namespace cuco {
 namespace detail {
 
@@ -42,6 +44,25 @@ __device__ __forceinline__ void copy_array(CG const &g, uint32_t n, Element *t,
   }
 }
 
+// float rows are copied with 16-byte float4 accesses when the row width and
+// alignment allow it; bulk assign/scatter_update traffic is bandwidth-bound,
+// so wider transactions are the whole win.
+template <typename CG>
+__device__ __forceinline__ void copy_array(CG const &g, uint32_t n, float *t, float const *s) {
+  if (n % 4 == 0 && reinterpret_cast<uintptr_t>(t) % 16 == 0 &&
+      reinterpret_cast<uintptr_t>(s) % 16 == 0) {
+    auto *t4 = reinterpret_cast<float4 *>(t);
+    auto const *s4 = reinterpret_cast<float4 const *>(s);
+    for (auto i = g.thread_rank(); i < n / 4; i += g.size()) {
+      t4[i] = s4[i];
+    }
+    return;
+  }
+  for (auto i = g.thread_rank(); i < n; i += g.size()) {
+    t[i] = s[i];
+  }
+}
+
 template <typename CG, typename Element>
 __device__ __forceinline__ void copy_array(CG const &g, uint32_t n, Element **t, Element const *s) {
   *t = const_cast<Element *>(s);
@@ -64,11 +85,51 @@ __device__ __forceinline__ void init_and_copy_array(CG const &g, uint32_t n, Ele
   *t2 = t1;
 }
 
-template <typename CG, typename Element>
+// When `Negate` is true the update is subtracted instead of added, so that a
+// scatter_sub does not need a negated copy of the update values.
+template <bool Negate = false, typename CG, typename Element>
 __device__ __forceinline__ void accumulate_array(CG const &g, uint32_t n, Element *t,
                                                  Element const *u) {
   for (auto i = g.thread_rank(); i < n; i += g.size()) {
-    t[i] += u[i];
+    t[i] += Negate ? -u[i] : u[i];
+  }
+}
+
+// The caller holds the slot lock, so the row is owned exclusively and the
+// read-modify-write can use plain float4 transactions. Duplicate keys
+// serialize on that lock, so fewer transactions per update directly
+// shortens the hold time.
+template <bool Negate = false, typename CG>
+__device__ __forceinline__ void accumulate_array(CG const &g, uint32_t n, float *t,
+                                                 float const *u) {
+  if (n % 4 == 0 && reinterpret_cast<uintptr_t>(t) % 16 == 0 &&
+      reinterpret_cast<uintptr_t>(u) % 16 == 0) {
+    auto *t4 = reinterpret_cast<float4 *>(t);
+    auto const *u4 = reinterpret_cast<float4 const *>(u);
+    for (auto i = g.thread_rank(); i < n / 4; i += g.size()) {
+      float4 acc = t4[i];
+      float4 upd = u4[i];
+      acc.x += Negate ? -upd.x : upd.x;
+      acc.y += Negate ? -upd.y : upd.y;
+      acc.z += Negate ? -upd.z : upd.z;
+      acc.w += Negate ? -upd.w : upd.w;
+      t4[i] = acc;
+    }
+    return;
+  }
+  for (auto i = g.thread_rank(); i < n; i += g.size()) {
+    t[i] += Negate ? -u[i] : u[i];
+  }
+}
+
+// bfloat16 storage accumulates in fp32 so repeated small updates are not
+// swallowed by the 8-bit mantissa.
+template <bool Negate = false, typename CG>
+__device__ __forceinline__ void accumulate_array(CG const &g, uint32_t n, __nv_bfloat16 *t,
+                                                 __nv_bfloat16 const *u) {
+  for (auto i = g.thread_rank(); i < n; i += g.size()) {
+    float update = __bfloat162float(u[i]);
+    t[i] = __float2bfloat16(__bfloat162float(t[i]) + (Negate ? -update : update));
   }
 }
 
@@ -80,5 +141,11 @@ __device__ __forceinline__ void update_array(CG const &g, uint32_t n, Element *t
   }
 }
 
+// Same float4 fast path as copy_array, for the scatter_update write.
+template <typename CG>
+__device__ __forceinline__ void update_array(CG const &g, uint32_t n, float *t, float const *u) {
+  copy_array(g, n, t, u);
+}
+
 }  // namespace detail
 }  // namespace cuco
\ No newline at end of file
@@ -115,7 +115,7 @@ class dynamic_map {
   void lookup(key_type const *keys, element_type **values, size_t num_keys, cudaStream_t stream = 0,
               Hash hash = Hash{});
 
-  template <typename Hash = cuco::detail::MurmurHash3_32<key_type>>
+  template <bool Negate = false, typename Hash = cuco::detail::MurmurHash3_32<key_type>>
   void scatter_add(key_type const *keys, element_type const *values, size_t num_keys,
                    cudaStream_t stream = 0, Hash hash = Hash{});
 
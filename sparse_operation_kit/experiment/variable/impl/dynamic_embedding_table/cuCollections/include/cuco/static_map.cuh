@@ -347,7 +347,7 @@ class static_map {
                                               pointer_pair_type const &lookup_or_insert_pair,
                                               Hash hash = Hash{}) noexcept;
 
-    template <typename CG, typename Hash = cuco::detail::MurmurHash3_32<key_type>>
+    template <bool Negate = false, typename CG, typename Hash = cuco::detail::MurmurHash3_32<key_type>>
     __device__ bool add(CG g, const_pair_type const &add_pair, Hash hash = Hash{}) noexcept;
 
     template <typename CG, typename Hash = cuco::detail::MurmurHash3_32<key_type>>
@@ -14,6 +14,8 @@
  * limitations under the License.
  */
 
+#include <cuda_bf16.h>
+
 #include "variable/impl/det_variable.h"
 #include "variable/impl/variable_base.h"
 
@@ -39,4 +41,16 @@ template std::shared_ptr<VariableBase<int64_t, float>> VariableFactory::create<i
     int64_t rows, int64_t cols, const std::string &type, const std::string &initializer,
     cudaStream_t stream);
 
+template std::shared_ptr<VariableBase<int32_t, __nv_bfloat16>>
+VariableFactory::create<int32_t, __nv_bfloat16>(int64_t rows, int64_t cols,
+                                                const std::string &type,
+                                                const std::string &initializer,
+                                                cudaStream_t stream);
+
+template std::shared_ptr<VariableBase<int64_t, __nv_bfloat16>>
+VariableFactory::create<int64_t, __nv_bfloat16>(int64_t rows, int64_t cols,
+                                                const std::string &type,
+                                                const std::string &initializer,
+                                                cudaStream_t stream);
+
 }  // namespace sok
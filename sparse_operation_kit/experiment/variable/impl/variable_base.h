@@ -41,6 +41,8 @@ class VariableBase {
                       cudaStream_t stream = 0) = 0;
   virtual void scatter_add(const KeyType *keys, const ValueType *values, size_t num_keys,
                            cudaStream_t stream = 0) = 0;
+  virtual void scatter_sub(const KeyType *keys, const ValueType *values, size_t num_keys,
+                           cudaStream_t stream = 0) = 0;
   virtual void scatter_update(const KeyType *keys, const ValueType *values, size_t num_keys,
                               cudaStream_t stream = 0) = 0;
 };
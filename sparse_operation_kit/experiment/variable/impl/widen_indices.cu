@@ -0,0 +1,39 @@
+/*
+ * Copyright (c) 2023, NVIDIA CORPORATION.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include "common/check.h"
+#include "variable/impl/widen_indices.h"
+
+namespace sok {
+
+__global__ static void WidenIndicesKernel(const int32_t *indices, int64_t *keys, size_t num_keys) {
+  size_t thread_cnt = blockDim.x * gridDim.x;
+  size_t thread_idx = blockDim.x * blockIdx.x + threadIdx.x;
+  for (size_t i = thread_idx; i < num_keys; i += thread_cnt) {
+    keys[i] = static_cast<int64_t>(__ldg(indices + i));
+  }
+}
+
+void WidenIndices(const int32_t *indices, int64_t *keys, size_t num_keys, cudaStream_t stream) {
+  if (num_keys == 0) {
+    return;
+  }
+  size_t grid_size = (num_keys + 1023) / 1024;
+  WidenIndicesKernel<<<grid_size, 1024ul, 0, stream>>>(indices, keys, num_keys);
+  CUDACHECK(cudaGetLastError());
+}
+
+}  // namespace sok
@@ -0,0 +1,32 @@
+/*
+ * Copyright (c) 2023, NVIDIA CORPORATION.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#ifndef WIDEN_INDICES_H
+#define WIDEN_INDICES_H
+
+#include <cuda_runtime_api.h>
+
+#include <cstdint>
+
+namespace sok {
+
+// Widens int32 indices to the int64 keys expected by the hash table. Used to
+// fold the dtype cast into the lookup op instead of emitting a tf.cast op.
+void WidenIndices(const int32_t *indices, int64_t *keys, size_t num_keys, cudaStream_t stream);
+
+}  // namespace sok
+
+#endif  // WIDEN_INDICES_H
@@ -14,6 +14,9 @@
  * limitations under the License.
  */
 
+#include <cuda_bf16.h>
+
+#include "variable/impl/cuembed_gather.h"
 #include "variable/kernels/dummy_var.h"
 
 namespace tensorflow {
@@ -77,6 +80,19 @@ void DummyVar<KeyType, ValueType>::SparseRead(const void* keys, void* values, si
                stream);
 }
 
+template <typename KeyType, typename ValueType>
+void DummyVar<KeyType, ValueType>::SparseReadCuEmbed(const void* keys, void* scratch_rows,
+                                                     void* values, size_t num_keys,
+                                                     cudaStream_t stream) {
+  check_var();
+  // The hash table probe only resolves the row pointers, the (memory-bound)
+  // row copy is done by the vectorized gather kernel.
+  var_->lookup(static_cast<const KeyType*>(keys), static_cast<ValueType**>(scratch_rows), num_keys,
+               stream);
+  sok::CuEmbedGather(static_cast<const ValueType* const*>(scratch_rows),
+                     static_cast<ValueType*>(values), num_keys, var_->cols(), stream);
+}
+
 template <typename KeyType, typename ValueType>
 void DummyVar<KeyType, ValueType>::ScatterAdd(const void* keys, const void* values, size_t num_keys,
                                               cudaStream_t stream) {
@@ -85,6 +101,14 @@ void DummyVar<KeyType, ValueType>::ScatterAdd(const void* keys, const void* valu
                     num_keys, stream);
 }
 
+template <typename KeyType, typename ValueType>
+void DummyVar<KeyType, ValueType>::ScatterSub(const void* keys, const void* values, size_t num_keys,
+                                              cudaStream_t stream) {
+  check_var();
+  var_->scatter_sub(static_cast<const KeyType*>(keys), static_cast<const ValueType*>(values),
+                    num_keys, stream);
+}
+
 template <typename KeyType, typename ValueType>
 void DummyVar<KeyType, ValueType>::ScatterUpdate(const void* keys, const void* values,
                                                  size_t num_keys, cudaStream_t stream) {
@@ -96,5 +120,7 @@ void DummyVar<KeyType, ValueType>::ScatterUpdate(const void* keys, const void* v
 // explicit instance the template
 template class DummyVar<int32_t, float>;
 template class DummyVar<int64_t, float>;
+template class DummyVar<int32_t, __nv_bfloat16>;
+template class DummyVar<int64_t, __nv_bfloat16>;
 
 }  // namespace tensorflow
@@ -55,7 +55,13 @@ class DummyVar : public ResourceBase {
   void Assign(const void *keys, const void *values, size_t num_keys, cudaStream_t stream);
 
   void SparseRead(const void *keys, void *values, size_t num_keys, cudaStream_t stream);
+  // Same as SparseRead, but copies the rows with the vectorized cuEmbed-style
+  // kernel. `scratch_rows` must be a device buffer of num_keys pointers and
+  // cols() % 4 must == 0.
+  void SparseReadCuEmbed(const void *keys, void *scratch_rows, void *values, size_t num_keys,
+                         cudaStream_t stream);
   void ScatterAdd(const void *keys, const void *values, size_t num_keys, cudaStream_t stream);
+  void ScatterSub(const void *keys, const void *values, size_t num_keys, cudaStream_t stream);
   void ScatterUpdate(const void *keys, const void *values, size_t num_keys, cudaStream_t stream);
 
   inline std::shared_ptr<sok::VariableBase<KeyType, ValueType>> get_var() { return var_; }
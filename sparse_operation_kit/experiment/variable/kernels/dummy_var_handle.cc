@@ -15,6 +15,8 @@
  */
 
 // clang-format off
+#include <cuda_bf16.h>
+
 #include "tensorflow/core/framework/op_kernel.h"
 #include "tensorflow/core/framework/register_types.h"
 #include "tensorflow/core/framework/resource_mgr.h"
@@ -112,9 +114,13 @@ class DummyVarHandleOp : public OpKernel {
 #if TF_VERSION_MAJOR == 1
 REGISTER_GPU_KERNELS(int64, int64_t, float, float);
 REGISTER_GPU_KERNELS(int32, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32, int32_t, Eigen::bfloat16, __nv_bfloat16);
 #else
 REGISTER_GPU_KERNELS(int64_t, int64_t, float, float);
 REGISTER_GPU_KERNELS(int32_t, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64_t, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32_t, int32_t, Eigen::bfloat16, __nv_bfloat16);
 #endif
 #undef REGISTER_GPU_KERNELS
 
@@ -212,9 +218,13 @@ class DummyVarInitializeOp : public OpKernel {
 #if TF_VERSION_MAJOR == 1
 REGISTER_GPU_KERNELS(int64, int64_t, float, float);
 REGISTER_GPU_KERNELS(int32, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32, int32_t, Eigen::bfloat16, __nv_bfloat16);
 #else
 REGISTER_GPU_KERNELS(int64_t, int64_t, float, float);
 REGISTER_GPU_KERNELS(int32_t, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64_t, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32_t, int32_t, Eigen::bfloat16, __nv_bfloat16);
 #endif
 #undef REGISTER_GPU_KERNELS
 
@@ -254,11 +264,19 @@ REGISTER_GPU_KERNELS(int64, int64_t, float, float, int32, int32_t);
 REGISTER_GPU_KERNELS(int32, int32_t, float, float, int32, int32_t);
 REGISTER_GPU_KERNELS(int64, int64_t, float, float, int64, int64_t);
 REGISTER_GPU_KERNELS(int32, int32_t, float, float, int64, int64_t);
+REGISTER_GPU_KERNELS(int64, int64_t, Eigen::bfloat16, __nv_bfloat16, int32, int32_t);
+REGISTER_GPU_KERNELS(int32, int32_t, Eigen::bfloat16, __nv_bfloat16, int32, int32_t);
+REGISTER_GPU_KERNELS(int64, int64_t, Eigen::bfloat16, __nv_bfloat16, int64, int64_t);
+REGISTER_GPU_KERNELS(int32, int32_t, Eigen::bfloat16, __nv_bfloat16, int64, int64_t);
 #else
 REGISTER_GPU_KERNELS(int64_t, int64_t, float, float, int32_t, int32_t);
 REGISTER_GPU_KERNELS(int32_t, int32_t, float, float, int32_t, int32_t);
 REGISTER_GPU_KERNELS(int64_t, int64_t, float, float, int64_t, int64_t);
 REGISTER_GPU_KERNELS(int32_t, int32_t, float, float, int64_t, int64_t);
+REGISTER_GPU_KERNELS(int64_t, int64_t, Eigen::bfloat16, __nv_bfloat16, int32_t, int32_t);
+REGISTER_GPU_KERNELS(int32_t, int32_t, Eigen::bfloat16, __nv_bfloat16, int32_t, int32_t);
+REGISTER_GPU_KERNELS(int64_t, int64_t, Eigen::bfloat16, __nv_bfloat16, int64_t, int64_t);
+REGISTER_GPU_KERNELS(int32_t, int32_t, Eigen::bfloat16, __nv_bfloat16, int64_t, int64_t);
 #endif
 #undef REGISTER_GPU_KERNELS
 
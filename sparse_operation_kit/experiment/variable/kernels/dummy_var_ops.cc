@@ -15,10 +15,14 @@
  */
 
 // clang-format off
+#include <cuda_bf16.h>
+
 #include "tensorflow/core/framework/op_kernel.h"
 #include "tensorflow/core/framework/register_types.h"
 #include "tensorflow/core/framework/resource_mgr.h"
+#include "tensorflow/core/framework/resource_var.h"
 
+#include "variable/impl/widen_indices.h"
 #include "variable/kernels/dummy_var.h"
 // clang-format on
 
@@ -74,9 +78,13 @@ class DummyVarAssignOp : public OpKernel {
 #if TF_VERSION_MAJOR == 1
 REGISTER_GPU_KERNELS(int64, int64_t, float, float);
 REGISTER_GPU_KERNELS(int32, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32, int32_t, Eigen::bfloat16, __nv_bfloat16);
 #else
 REGISTER_GPU_KERNELS(int64_t, int64_t, float, float);
 REGISTER_GPU_KERNELS(int32_t, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64_t, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32_t, int32_t, Eigen::bfloat16, __nv_bfloat16);
 #endif
 #undef REGISTER_GPU_KERNELS
 
@@ -126,9 +134,13 @@ class DummyVarExportOp : public OpKernel {
 #if TF_VERSION_MAJOR == 1
 REGISTER_GPU_KERNELS(int64, int64_t, float, float);
 REGISTER_GPU_KERNELS(int32, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32, int32_t, Eigen::bfloat16, __nv_bfloat16);
 #else
 REGISTER_GPU_KERNELS(int64_t, int64_t, float, float);
 REGISTER_GPU_KERNELS(int32_t, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64_t, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32_t, int32_t, Eigen::bfloat16, __nv_bfloat16);
 #endif
 #undef REGISTER_GPU_KERNELS
 
@@ -173,16 +185,214 @@ class DummyVarSparseReadOp : public OpKernel {
 #if TF_VERSION_MAJOR == 1
 REGISTER_GPU_KERNELS(int64, int64_t, float, float);
 REGISTER_GPU_KERNELS(int32, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32, int32_t, Eigen::bfloat16, __nv_bfloat16);
 // REGISTER_GPU_KERNELS(int64, int64_t, Eigen::half, __half);
 // REGISTER_GPU_KERNELS(int32, int32_t, Eigen::half, __half);
 #else
 REGISTER_GPU_KERNELS(int64_t, int64_t, float, float);
 REGISTER_GPU_KERNELS(int32_t, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64_t, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32_t, int32_t, Eigen::bfloat16, __nv_bfloat16);
 // REGISTER_GPU_KERNELS(int64_t, int64_t, Eigen::half, __half);
 // REGISTER_GPU_KERNELS(int32_t, int32_t, Eigen::half, __half);
 #endif
 #undef REGISTER_GPU_KERNELS
 
+// -----------------------------------------------------------------------------------------------
+// DummyVarSparseReadI32
+// -----------------------------------------------------------------------------------------------
+template <typename ValueType>
+class DummyVarSparseReadI32Op : public OpKernel {
+ public:
+  explicit DummyVarSparseReadI32Op(OpKernelConstruction* ctx) : OpKernel(ctx) {}
+
+  void Compute(OpKernelContext* ctx) override {
+    core::RefCountPtr<DummyVar<int64_t, ValueType>> var;
+    OP_REQUIRES_OK(ctx, LookupResource(ctx, HandleFromInput(ctx, 0), &var));
+
+    tf_shared_lock ml(*var->mu());
+
+    const Tensor* indices = nullptr;
+    OP_REQUIRES_OK(ctx, ctx->input("indices", &indices));
+
+    // Allocate output
+    int64_t N = indices->NumElements();
+    Tensor* output = nullptr;
+    OP_REQUIRES_OK(ctx, ctx->allocate_output(0, {N, var->cols()}, &output));
+
+    // Get cuda stream of tensorflow
+    auto device_ctx = ctx->op_device_context();
+    OP_REQUIRES(ctx, device_ctx != nullptr, errors::Aborted("No valid device context."));
+    cudaStream_t stream = stream_executor::gpu::AsGpuStreamValue(device_ctx->stream());
+
+    // Widen the int32 indices to the int64 keys of the table inside this op,
+    // so that no separate tf.cast op shows up on the lookup hot path.
+    Tensor keys;
+    OP_REQUIRES_OK(ctx, ctx->allocate_temp(DT_INT64, {N}, &keys));
+    sok::WidenIndices(static_cast<const int32_t*>(indices->data()),
+                      static_cast<int64_t*>(keys.data()), N, stream);
+
+    if (var->cols() % 4 == 0) {
+      Tensor scratch_rows;
+      OP_REQUIRES_OK(ctx, ctx->allocate_temp(DT_UINT64, {N}, &scratch_rows));
+      var->SparseReadCuEmbed(keys.data(), scratch_rows.data(), output->data(), N, stream);
+    } else {
+      var->SparseRead(keys.data(), output->data(), N, stream);
+    }
+  }
+};
+
+#define REGISTER_GPU_KERNELS(key_type_tf, dtype_tf, dtype)             \
+  REGISTER_KERNEL_BUILDER(Name("DummyVarSparseReadI32")                \
+                              .Device(DEVICE_GPU)                      \
+                              .HostMemory("resource")                  \
+                              .TypeConstraint<key_type_tf>("key_type") \
+                              .TypeConstraint<dtype_tf>("dtype"),      \
+                          DummyVarSparseReadI32Op<dtype>)
+#if TF_VERSION_MAJOR == 1
+REGISTER_GPU_KERNELS(int64, float, float);
+#else
+REGISTER_GPU_KERNELS(int64_t, float, float);
+#endif
+#undef REGISTER_GPU_KERNELS
+
+// -----------------------------------------------------------------------------------------------
+// DummyVarSparseReadCuembed
+// -----------------------------------------------------------------------------------------------
+template <typename KeyType, typename ValueType>
+class DummyVarSparseReadCuembedOp : public OpKernel {
+ public:
+  explicit DummyVarSparseReadCuembedOp(OpKernelConstruction* ctx) : OpKernel(ctx) {}
+
+  void Compute(OpKernelContext* ctx) override {
+    core::RefCountPtr<DummyVar<KeyType, ValueType>> var;
+    OP_REQUIRES_OK(ctx, LookupResource(ctx, HandleFromInput(ctx, 0), &var));
+
+    tf_shared_lock ml(*var->mu());
+
+    const Tensor* indices = nullptr;
+    OP_REQUIRES_OK(ctx, ctx->input("indices", &indices));
+
+    OP_REQUIRES(ctx, var->cols() % 4 == 0,
+                errors::InvalidArgument("DummyVarSparseReadCuembed requires dimension % 4 == 0, ",
+                                        "but got dimension = ", var->cols()));
+
+    // Allocate output
+    int64_t N = indices->NumElements();
+    Tensor* output = nullptr;
+    OP_REQUIRES_OK(ctx, ctx->allocate_output(0, {N, var->cols()}, &output));
+
+    // Scratch buffer that holds the device pointers of the rows to gather
+    Tensor scratch_rows;
+    OP_REQUIRES_OK(ctx, ctx->allocate_temp(DT_UINT64, {N}, &scratch_rows));
+
+    // Get cuda stream of tensorflow
+    auto device_ctx = ctx->op_device_context();
+    OP_REQUIRES(ctx, device_ctx != nullptr, errors::Aborted("No valid device context."));
+    cudaStream_t stream = stream_executor::gpu::AsGpuStreamValue(device_ctx->stream());
+
+    var->SparseReadCuEmbed(indices->data(), scratch_rows.data(), output->data(), N, stream);
+  }
+};
+
+#define REGISTER_GPU_KERNELS(key_type_tf, key_type, dtype_tf, dtype)   \
+  REGISTER_KERNEL_BUILDER(Name("DummyVarSparseReadCuembed")            \
+                              .Device(DEVICE_GPU)                      \
+                              .HostMemory("resource")                  \
+                              .TypeConstraint<key_type_tf>("key_type") \
+                              .TypeConstraint<dtype_tf>("dtype"),      \
+                          DummyVarSparseReadCuembedOp<key_type, dtype>)
+#if TF_VERSION_MAJOR == 1
+REGISTER_GPU_KERNELS(int64, int64_t, float, float);
+REGISTER_GPU_KERNELS(int32, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32, int32_t, Eigen::bfloat16, __nv_bfloat16);
+#else
+REGISTER_GPU_KERNELS(int64_t, int64_t, float, float);
+REGISTER_GPU_KERNELS(int32_t, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64_t, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32_t, int32_t, Eigen::bfloat16, __nv_bfloat16);
+#endif
+#undef REGISTER_GPU_KERNELS
+
+// -----------------------------------------------------------------------------------------------
+// DummyVarSparseReadAssign
+// -----------------------------------------------------------------------------------------------
+template <typename KeyType, typename ValueType>
+class DummyVarSparseReadAssignOp : public OpKernel {
+ public:
+  explicit DummyVarSparseReadAssignOp(OpKernelConstruction* ctx) : OpKernel(ctx) {
+    OP_REQUIRES_OK(ctx, ctx->GetAttr("dtype", &dtype_));
+  }
+
+  void Compute(OpKernelContext* ctx) override {
+    core::RefCountPtr<DummyVar<KeyType, ValueType>> var;
+    OP_REQUIRES_OK(ctx, LookupResource(ctx, HandleFromInput(ctx, 0), &var));
+
+    tf_shared_lock ml(*var->mu());
+
+    const Tensor* indices = nullptr;
+    OP_REQUIRES_OK(ctx, ctx->input("indices", &indices));
+
+    // Gather straight into the tensor that becomes the static buffer, so the
+    // rows are not staged through a sparse_read output first.
+    int64_t N = indices->NumElements();
+    Tensor buffer;
+    OP_REQUIRES_OK(ctx, ctx->allocate_temp(dtype_, {N, var->cols()}, &buffer));
+
+    // Get cuda stream of tensorflow
+    auto device_ctx = ctx->op_device_context();
+    OP_REQUIRES(ctx, device_ctx != nullptr, errors::Aborted("No valid device context."));
+    cudaStream_t stream = stream_executor::gpu::AsGpuStreamValue(device_ctx->stream());
+
+    if (var->cols() % 4 == 0) {
+      Tensor scratch_rows;
+      OP_REQUIRES_OK(ctx, ctx->allocate_temp(DT_UINT64, {N}, &scratch_rows));
+      var->SparseReadCuEmbed(indices->data(), scratch_rows.data(), buffer.data(), N, stream);
+    } else {
+      var->SparseRead(indices->data(), buffer.data(), N, stream);
+    }
+
+    // Hand the buffer to the destination variable, as AssignVariableOp does
+    // when it can take ownership of the input.
+    core::RefCountPtr<Var> dst;
+    const auto dtype = dtype_;
+    OP_REQUIRES_OK(ctx, LookupOrCreateResource<Var>(ctx, HandleFromInput(ctx, 1), &dst,
+                                                    [dtype](Var** ptr) {
+                                                      *ptr = new Var(dtype);
+                                                      return Status::OK();
+                                                    }));
+    mutex_lock ml_dst(*dst->mu());
+    dst->is_initialized = true;
+    *dst->tensor() = buffer;
+  }
+
+ private:
+  DataType dtype_;
+};
+
+#define REGISTER_GPU_KERNELS(key_type_tf, key_type, dtype_tf, dtype)   \
+  REGISTER_KERNEL_BUILDER(Name("DummyVarSparseReadAssign")             \
+                              .Device(DEVICE_GPU)                      \
+                              .HostMemory("resource")                  \
+                              .HostMemory("dst")                       \
+                              .TypeConstraint<key_type_tf>("key_type") \
+                              .TypeConstraint<dtype_tf>("dtype"),      \
+                          DummyVarSparseReadAssignOp<key_type, dtype>)
+#if TF_VERSION_MAJOR == 1
+REGISTER_GPU_KERNELS(int64, int64_t, float, float);
+REGISTER_GPU_KERNELS(int32, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32, int32_t, Eigen::bfloat16, __nv_bfloat16);
+#else
+REGISTER_GPU_KERNELS(int64_t, int64_t, float, float);
+REGISTER_GPU_KERNELS(int32_t, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64_t, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32_t, int32_t, Eigen::bfloat16, __nv_bfloat16);
+#endif
+#undef REGISTER_GPU_KERNELS
+
 // -----------------------------------------------------------------------------------------------
 // DummyVarScatterAdd
 // -----------------------------------------------------------------------------------------------
@@ -222,9 +432,62 @@ class DummyVarScatterAddOp : public OpKernel {
 #if TF_VERSION_MAJOR == 1
 REGISTER_GPU_KERNELS(int64, int64_t, float, float);
 REGISTER_GPU_KERNELS(int32, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32, int32_t, Eigen::bfloat16, __nv_bfloat16);
+#else
+REGISTER_GPU_KERNELS(int64_t, int64_t, float, float);
+REGISTER_GPU_KERNELS(int32_t, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64_t, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32_t, int32_t, Eigen::bfloat16, __nv_bfloat16);
+#endif
+#undef REGISTER_GPU_KERNELS
+
+// -----------------------------------------------------------------------------------------------
+// DummyVarScatterSub
+// -----------------------------------------------------------------------------------------------
+template <typename KeyType, typename ValueType>
+class DummyVarScatterSubOp : public OpKernel {
+ public:
+  explicit DummyVarScatterSubOp(OpKernelConstruction* ctx) : OpKernel(ctx) {}
+
+  void Compute(OpKernelContext* ctx) override {
+    core::RefCountPtr<DummyVar<KeyType, ValueType>> var;
+    OP_REQUIRES_OK(ctx, LookupResource(ctx, HandleFromInput(ctx, 0), &var));
+
+    tf_shared_lock ml(*var->mu());
+
+    const Tensor* indices = nullptr;
+    OP_REQUIRES_OK(ctx, ctx->input("indices", &indices));
+    const Tensor* updates = nullptr;
+    OP_REQUIRES_OK(ctx, ctx->input("updates", &updates));
+
+    auto device_ctx = ctx->op_device_context();
+    OP_REQUIRES(ctx, device_ctx != nullptr, errors::Aborted("No valid device context."));
+    cudaStream_t stream = stream_executor::gpu::AsGpuStreamValue(device_ctx->stream());
+
+    // Do scatter sub
+    int64_t N = indices->NumElements();
+    var->ScatterSub(indices->data(), updates->data(), N, stream);
+  }
+};
+
+#define REGISTER_GPU_KERNELS(key_type_tf, key_type, dtype_tf, dtype)   \
+  REGISTER_KERNEL_BUILDER(Name("DummyVarScatterSub")                   \
+                              .Device(DEVICE_GPU)                      \
+                              .HostMemory("resource")                  \
+                              .TypeConstraint<key_type_tf>("key_type") \
+                              .TypeConstraint<dtype_tf>("dtype"),      \
+                          DummyVarScatterSubOp<key_type, dtype>)
+#if TF_VERSION_MAJOR == 1
+REGISTER_GPU_KERNELS(int64, int64_t, float, float);
+REGISTER_GPU_KERNELS(int32, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32, int32_t, Eigen::bfloat16, __nv_bfloat16);
 #else
 REGISTER_GPU_KERNELS(int64_t, int64_t, float, float);
 REGISTER_GPU_KERNELS(int32_t, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64_t, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32_t, int32_t, Eigen::bfloat16, __nv_bfloat16);
 #endif
 #undef REGISTER_GPU_KERNELS
 
@@ -267,9 +530,13 @@ class DummyVarScatterUpdateOp : public OpKernel {
 #if TF_VERSION_MAJOR == 1
 REGISTER_GPU_KERNELS(int64, int64_t, float, float);
 REGISTER_GPU_KERNELS(int32, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32, int32_t, Eigen::bfloat16, __nv_bfloat16);
 #else
 REGISTER_GPU_KERNELS(int64_t, int64_t, float, float);
 REGISTER_GPU_KERNELS(int32_t, int32_t, float, float);
+REGISTER_GPU_KERNELS(int64_t, int64_t, Eigen::bfloat16, __nv_bfloat16);
+REGISTER_GPU_KERNELS(int32_t, int32_t, Eigen::bfloat16, __nv_bfloat16);
 #endif
 #undef REGISTER_GPU_KERNELS
 
@@ -30,7 +30,7 @@ REGISTER_OP("DummyVarHandle")
     .Attr("shared_name: string")
     .Attr("shape: shape")
     .Attr("key_type: {int32, int64} = DT_INT64")
-    .Attr("dtype: {float32} = DT_FLOAT")
+    .Attr("dtype: {float32, bfloat16} = DT_FLOAT")
     .Output("resource: resource")
     .SetIsStateful()
     .SetShapeFn([](InferenceContext* c) {
@@ -71,7 +71,7 @@ REGISTER_OP("DummyVarInitialize")
     .Attr("init_dtype: {float32, string}")
     .Attr("unique_name: string")
     .Attr("key_type: {int32, int64} = DT_INT64")
-    .Attr("dtype: {float32} = DT_FLOAT")
+    .Attr("dtype: {float32, bfloat16} = DT_FLOAT")
     .SetShapeFn([](InferenceContext* c) { return Status::OK(); });
 
 REGISTER_OP("DummyVarShape")
@@ -79,7 +79,7 @@ REGISTER_OP("DummyVarShape")
     .Output("output: out_type")
     .Attr("out_type: {int32, int64} = DT_INT32")
     .Attr("key_type: {int32, int64} = DT_INT64")
-    .Attr("dtype: {float32} = DT_FLOAT")
+    .Attr("dtype: {float32, bfloat16} = DT_FLOAT")
     .SetShapeFn([](InferenceContext* c) {
       c->set_output(0, c->Vector(2));
       return Status::OK();
@@ -30,7 +30,7 @@ REGISTER_OP("DummyVarAssign")
     .Input("indices: key_type")
     .Input("values: dtype")
     .Attr("key_type: {int32, int64}")
-    .Attr("dtype: {float32}")
+    .Attr("dtype: {float32, bfloat16}")
     .SetShapeFn([](InferenceContext* c) { return Status::OK(); });
 
 REGISTER_OP("DummyVarExport")
@@ -38,7 +38,7 @@ REGISTER_OP("DummyVarExport")
     .Output("indices: key_type")
     .Output("values: dtype")
     .Attr("key_type: {int32, int64} = DT_INT64")
-    .Attr("dtype: {float32} = DT_FLOAT")
+    .Attr("dtype: {float32, bfloat16} = DT_FLOAT")
     .SetShapeFn([](InferenceContext* c) { return Status::OK(); });
 
 REGISTER_OP("DummyVarSparseRead")
@@ -46,7 +46,7 @@ REGISTER_OP("DummyVarSparseRead")
     .Input("indices: key_type")
     .Output("output: dtype")
     .Attr("key_type: {int32, int64}")
-    .Attr("dtype: {float32, float16} = DT_FLOAT")
+    .Attr("dtype: {float32, float16, bfloat16} = DT_FLOAT")
     .SetShapeFn([](InferenceContext* c) {
       // Get handle.shape[1]
       auto handle_shapes_and_types = c->input_handle_shapes_and_types(0);
@@ -66,6 +66,72 @@ REGISTER_OP("DummyVarSparseRead")
       return Status::OK();
     });
 
+// Same semantics as DummyVarSparseRead on an int64-keyed table, but takes
+// int32 indices and widens them inside the op instead of requiring a
+// preceding Cast op.
+REGISTER_OP("DummyVarSparseReadI32")
+    .Input("resource: resource")
+    .Input("indices: int32")
+    .Output("output: dtype")
+    .Attr("key_type: {int64} = DT_INT64")
+    .Attr("dtype: {float32} = DT_FLOAT")
+    .SetShapeFn([](InferenceContext* c) {
+      // Get handle.shape[1]
+      auto handle_shapes_and_types = c->input_handle_shapes_and_types(0);
+      auto handle_shape = (*handle_shapes_and_types)[0].shape;
+      ShapeHandle handle_shape_1;
+      TF_RETURN_IF_ERROR(c->Subshape(handle_shape, 1, 2, &handle_shape_1));
+
+      // rank(indices) should == 1
+      ShapeHandle indices_shape;
+      TF_RETURN_IF_ERROR(c->WithRank(c->input(1), 1, &indices_shape));
+
+      // Set output shape = [indices.shape[0], handle.shape[1]]
+      ShapeHandle output_shape;
+      TF_RETURN_IF_ERROR(c->Concatenate(c->input(1), handle_shape_1, &output_shape));
+      c->set_output(0, output_shape);
+
+      return Status::OK();
+    });
+
+// Same semantics as DummyVarSparseRead, but the row copy is done by the
+// vectorized cuEmbed-style kernel. Only valid when dimension % 4 == 0.
+REGISTER_OP("DummyVarSparseReadCuembed")
+    .Input("resource: resource")
+    .Input("indices: key_type")
+    .Output("output: dtype")
+    .Attr("key_type: {int32, int64}")
+    .Attr("dtype: {float32, bfloat16} = DT_FLOAT")
+    .SetShapeFn([](InferenceContext* c) {
+      // Get handle.shape[1]
+      auto handle_shapes_and_types = c->input_handle_shapes_and_types(0);
+      auto handle_shape = (*handle_shapes_and_types)[0].shape;
+      ShapeHandle handle_shape_1;
+      TF_RETURN_IF_ERROR(c->Subshape(handle_shape, 1, 2, &handle_shape_1));
+
+      // rank(indices) should == 1
+      ShapeHandle indices_shape;
+      TF_RETURN_IF_ERROR(c->WithRank(c->input(1), 1, &indices_shape));
+
+      // Set output shape = [indices.shape[0], handle.shape[1]]
+      ShapeHandle output_shape;
+      TF_RETURN_IF_ERROR(c->Concatenate(c->input(1), handle_shape_1, &output_shape));
+      c->set_output(0, output_shape);
+
+      return Status::OK();
+    });
+
+// Fused sparse_read + assign used by DynamicVariable.to_static: gathers the
+// rows for `indices` from the dummy variable straight into the tensor of the
+// destination resource variable, skipping the intermediate output tensor.
+REGISTER_OP("DummyVarSparseReadAssign")
+    .Input("resource: resource")
+    .Input("dst: resource")
+    .Input("indices: key_type")
+    .Attr("key_type: {int32, int64}")
+    .Attr("dtype: {float32, bfloat16} = DT_FLOAT")
+    .SetShapeFn([](InferenceContext* c) { return Status::OK(); });
+
 namespace {
 Status DummyVarScatterShapeFn(InferenceContext* c) {
   // Get handle.shape[1]
@@ -96,7 +162,15 @@ REGISTER_OP("DummyVarScatterAdd")
     .Input("indices: key_type")
     .Input("updates: dtype")
     .Attr("key_type: {int32, int64}")
-    .Attr("dtype: {float32}")
+    .Attr("dtype: {float32, bfloat16}")
+    .SetShapeFn(DummyVarScatterShapeFn);
+
+REGISTER_OP("DummyVarScatterSub")
+    .Input("resource: resource")
+    .Input("indices: key_type")
+    .Input("updates: dtype")
+    .Attr("key_type: {int32, int64}")
+    .Attr("dtype: {float32, bfloat16}")
     .SetShapeFn(DummyVarScatterShapeFn);
 
 REGISTER_OP("DummyVarScatterUpdate")
@@ -104,7 +178,7 @@ REGISTER_OP("DummyVarScatterUpdate")
     .Input("indices: key_type")
     .Input("updates: dtype")
     .Attr("key_type: {int32, int64}")
-    .Attr("dtype: {float32}")
+    .Attr("dtype: {float32, bfloat16}")
     .SetShapeFn(DummyVarScatterShapeFn);
 
 }  // namespace tensorflow
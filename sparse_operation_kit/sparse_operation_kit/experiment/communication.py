@@ -14,6 +14,8 @@
  limitations under the License.
 """
 
+import functools
+
 # We don't want the whole process to quit bacause of the import failure when
 # we don't use horovod to do communication.
 try:
@@ -207,7 +209,11 @@ def global_gpu_id():
     return _COMM_TOOL.global_gpu_id()
 
 
+@functools.lru_cache(maxsize=1)
 def num_gpus():
+    # The GPU count is fixed for the lifetime of the process, so the
+    # communication tool is only queried once. A call before sok.init() still
+    # raises and is not cached.
     check_comm_tool()
     return _COMM_TOOL.num_gpus()
 
@@ -43,10 +43,15 @@ class DynamicVariable(ResourceVariable):
         self._dimension = dimension
         self._indices = None
         self._mode = mode
+        # Parse the "localized:N" mode string once instead of on every
+        # target_gpu access.
+        self._target_gpu = -1
+        if mode is not None and mode[: len("localized")] == "localized":
+            self._target_gpu = int(mode.split(":")[1])
 
         self._base = super(DynamicVariable, self)
         self._base.__init__(
-            initial_value=[[0.0] * dimension],
+            initial_value=tf.zeros([1, dimension], dtype=self._handle_dtype),
             trainable=trainable,
             name="DynamicVariableBuffer",
             dtype=self._handle_dtype,
@@ -101,7 +106,12 @@ class DynamicVariable(ResourceVariable):
                     self._dummy_handle = handle
                     # Note that the default handle will be sok's handle
                     self._handle = self._dummy_handle
-                    self._initializer_op = tf.group([self._initializer_op, init_op])
+                    if context.executing_eagerly():
+                        # Both initializers have already run at this point, so
+                        # don't build a group op per variable.
+                        self._initializer_op = init_op
+                    else:
+                        self._initializer_op = tf.group([self._initializer_op, init_op])
                     # self._is_initialized_op = tf.group([self._is_initialized_op, is_initialized_op])
 
             handle_data = (
@@ -117,15 +127,33 @@ class DynamicVariable(ResourceVariable):
                 self._handle, handle_data, graph_mode=False if context.executing_eagerly() else True
             )
 
+        self._bind_dynamic_scatter()
+
+    def _bind_dynamic_scatter(self):
+        # Shadow the generic scatter dispatchers with the dynamic-mode fast
+        # paths so per-step scatters skip the mode and IndexedSlices checks.
+        self.scatter_add = self._scatter_add_dynamic
+        self.scatter_sub = self._scatter_sub_dynamic
+        self.scatter_update = self._scatter_update_dynamic
+
+    def _unbind_dynamic_scatter(self):
+        for method in ("scatter_add", "scatter_sub", "scatter_update"):
+            self.__dict__.pop(method, None)
+
     def is_static(self):
         return self._handle is self._tf_handle
 
     def to_static(self, indices):
         if not self.is_static() and self._indices is None:
-            buffer = self.sparse_read(indices)
+            # Fused gather-and-assign: the rows land in the static buffer
+            # directly instead of passing through a sparse_read output first.
+            to_static_op = dynamic_variable_ops.dummy_var_sparse_read_assign(
+                self._dummy_handle, self._tf_handle, indices, dtype=self._handle_dtype
+            )
             self._indices = indices
             self._handle = self._tf_handle
-            return self.assign(buffer)
+            self._unbind_dynamic_scatter()
+            return to_static_op
         else:
             raise RuntimeError("to_static() must be called in dynamic mode.")
 
@@ -135,6 +163,7 @@ class DynamicVariable(ResourceVariable):
             sparse_delta = ops.IndexedSlices(buffer, self._indices, self.shape)
             self._indices = None
             self._handle = self._dummy_handle
+            self._bind_dynamic_scatter()
             return self.scatter_update(sparse_delta)
         else:
             raise RuntimeError("to_dynamic() must be called in static mode.")
@@ -172,15 +201,14 @@ class DynamicVariable(ResourceVariable):
 
     @property
     def target_gpu(self):
-        if self._mode is not None and self._mode[: len("localized")] == "localized":
-            target_gpu = int(self._mode.split(":")[1])
-            if target_gpu >= num_gpus():
+        if self._target_gpu >= 0:
+            total_gpus = num_gpus()
+            if self._target_gpu >= total_gpus:
                 raise RuntimeError(
                     "There are only %d GPU(s), cannot put embedding table on %dth(zero-indexed) GPU."
-                    % (num_gpus(), target_gpu)
+                    % (total_gpus, self._target_gpu)
                 )
-            return target_gpu
-        return -1
+        return self._target_gpu
 
     @property
     def num_gpus(self):
@@ -198,21 +226,49 @@ class DynamicVariable(ResourceVariable):
             return self._base.sparse_read(indices, name)
 
         variable_accessed(self)
+        if (
+            indices.dtype == tf.int32
+            and self._key_type == tf.int64
+            and self._handle_dtype == tf.float32
+        ):
+            # The widening to int64 happens inside the op, so no int64 copy of
+            # the indices is materialized by a tf.cast op.
+            return dynamic_variable_ops.dummy_var_sparse_read_i32(
+                self._dummy_handle, indices, dtype=self._handle_dtype
+            )
         if indices.dtype == tf.int32:
             indices = tf.cast(indices, tf.int64)
+        if (
+            indices.dtype == tf.int64
+            and self._handle_dtype in (tf.float32, tf.bfloat16)
+            and self._dimension % 4 == 0
+        ):
+            # Memory-level-parallelism optimized lookup, see cuembed_gather.cu
+            return dynamic_variable_ops.dummy_var_sparse_read_cuembed(
+                self._dummy_handle, indices, dtype=self._handle_dtype
+            )
         return dynamic_variable_ops.dummy_var_sparse_read(
             self._dummy_handle, indices, dtype=self._handle_dtype
         )
 
+    def _scatter_values(self, sparse_delta):
+        # When the dtype already matches, convert_to_tensor would just
+        # re-dispatch a no-op cast; skip it to keep the eager hot path short.
+        if sparse_delta.values.dtype == self.dtype:
+            return sparse_delta.values
+        return ops.convert_to_tensor(sparse_delta.values, self.dtype)
+
     def scatter_sub(self, sparse_delta, use_locking=False, name=None):
         if self.is_static():
             return self._base.scatter_sub(sparse_delta, use_locking, name)
         if not isinstance(sparse_delta, ops.IndexedSlices):
             raise TypeError("sparse_delta is not IndexedSlices: %s" % sparse_delta)
-        return dynamic_variable_ops.dummy_var_scatter_add(
+        # The scatter kernel negates the updates on the fly, so no negated
+        # copy of the values is materialized here.
+        return dynamic_variable_ops.dummy_var_scatter_sub(
             self._dummy_handle,
             sparse_delta.indices,
-            ops.convert_to_tensor(-sparse_delta.values, self.dtype),
+            self._scatter_values(sparse_delta),
         )
 
     def scatter_add(self, sparse_delta, use_locking=False, name=None):
@@ -223,7 +279,7 @@ class DynamicVariable(ResourceVariable):
         return dynamic_variable_ops.dummy_var_scatter_add(
             self._dummy_handle,
             sparse_delta.indices,
-            ops.convert_to_tensor(sparse_delta.values, self.dtype),
+            self._scatter_values(sparse_delta),
         )
 
     def scatter_update(self, sparse_delta, use_locking=False, name=None):
@@ -234,7 +290,32 @@ class DynamicVariable(ResourceVariable):
         return dynamic_variable_ops.dummy_var_scatter_update(
             self._dummy_handle,
             sparse_delta.indices,
-            ops.convert_to_tensor(sparse_delta.values, self.dtype),
+            self._scatter_values(sparse_delta),
+        )
+
+    # Dynamic-mode fast paths bound as instance attributes while the variable
+    # is dynamic (see _bind_dynamic_scatter). They assume sparse_delta is an
+    # IndexedSlices, which every in-tree caller guarantees.
+
+    def _scatter_sub_dynamic(self, sparse_delta, use_locking=False, name=None):
+        return dynamic_variable_ops.dummy_var_scatter_sub(
+            self._dummy_handle,
+            sparse_delta.indices,
+            self._scatter_values(sparse_delta),
+        )
+
+    def _scatter_add_dynamic(self, sparse_delta, use_locking=False, name=None):
+        return dynamic_variable_ops.dummy_var_scatter_add(
+            self._dummy_handle,
+            sparse_delta.indices,
+            self._scatter_values(sparse_delta),
+        )
+
+    def _scatter_update_dynamic(self, sparse_delta, use_locking=False, name=None):
+        return dynamic_variable_ops.dummy_var_scatter_update(
+            self._dummy_handle,
+            sparse_delta.indices,
+            self._scatter_values(sparse_delta),
         )
 
     # -------------------------------------------------------------------------
@@ -349,15 +430,56 @@ class DynamicVariable(ResourceVariable):
         raise NotImplementedError("__int__() is not supported in dynamic mode.")
 
 
+def _sparse_read_dense_shape(op):
+    """Dense shape of the variable behind a sparse_read op.
+
+    The dimension is propagated by the op's shape function, so in the common
+    case the shape is built from a constant instead of launching a
+    dummy_var_shape query per backward pass. The row count of a dynamic
+    variable is unknown at build time and is not consumed by the scatter
+    path, so -1 stands in for it.
+
+    Both branches return int64 so the reshape fallback in the gradients can
+    mix the result with sizes of either branch.
+    """
+    dim = op.outputs[0].shape[-1]
+    if dim is not None:
+        return tf.constant([-1, dim], dtype=tf.int64)
+    return dynamic_variable_ops.dummy_var_shape(
+        op.inputs[0],
+        out_type=tf.int64,
+        key_type=op.get_attr("key_type"),
+        dtype=op.get_attr("dtype"),
+    )
+
+
+@tf.RegisterGradient("DummyVarSparseReadCuembed")
 @tf.RegisterGradient("DummyVarSparseRead")
 def _SparseReadGrad(op, grad):
     """Gradient for sparse_read."""
-    handle = op.inputs[0]
     indices = op.inputs[1]
-    key_type = op.get_attr("key_type")
-    dtype = op.get_attr("dtype")
-    variable_shape = dynamic_variable_ops.dummy_var_shape(handle, key_type=key_type, dtype=dtype)
-    size = array_ops.expand_dims(array_ops.size(indices), 0)
+    variable_shape = _sparse_read_dense_shape(op)
+    if grad.shape.rank == 2 and indices.shape.rank == 1:
+        # The op contract already guarantees rank-1 indices and a
+        # [num_indices, dimension] gradient, so no reshape ops are needed.
+        return (ops.IndexedSlices(grad, indices, variable_shape), None)
+    size = array_ops.expand_dims(array_ops.size(indices, out_type=variable_shape.dtype), 0)
+    values_shape = array_ops.concat([size, variable_shape[1:]], 0)
+    grad = array_ops.reshape(grad, values_shape)
+    indices = array_ops.reshape(indices, size)
+    return (ops.IndexedSlices(grad, indices, variable_shape), None)
+
+
+@tf.RegisterGradient("DummyVarSparseReadI32")
+def _SparseReadI32Grad(op, grad):
+    """Gradient for sparse_read with int32 indices."""
+    # The table is keyed on int64, so the scatter of the gradient expects
+    # int64 indices.
+    indices = tf.cast(op.inputs[1], tf.int64)
+    variable_shape = _sparse_read_dense_shape(op)
+    if grad.shape.rank == 2 and indices.shape.rank == 1:
+        return (ops.IndexedSlices(grad, indices, variable_shape), None)
+    size = array_ops.expand_dims(array_ops.size(indices, out_type=variable_shape.dtype), 0)
     values_shape = array_ops.concat([size, variable_shape[1:]], 0)
     grad = array_ops.reshape(grad, values_shape)
     indices = array_ops.reshape(indices, size)
@@ -366,12 +488,12 @@ def _SparseReadGrad(op, grad):
 
 def export(var):
     if isinstance(var, DynamicVariable):
+        # The outputs of dummy_var_export are host tensors already (the op
+        # DMAs them through pinned memory), so no extra identity copy on CPU
+        # is needed.
         indices, values = dynamic_variable_ops.dummy_var_export(
             var.handle, key_type=var.key_type, dtype=var.handle_dtype
         )
-        with tf.device("CPU"):
-            indices = tf.identity(indices)
-            values = tf.identity(values)
         return indices, values
 
 
@@ -200,15 +200,48 @@ class OptimizerWrapperV2(object):
 class SGD(object):
     def __init__(self, lr):
         self._lr = tf.Variable(lr)
+        # One compiled update graph per variable set, see apply_gradients.
+        self._graph_fns = {}
 
     @property
     def lr(self):
         return self._lr
 
+    def _graph_fn(self, var_list):
+        # In eager mode the per-table scatter launches dominate small updates,
+        # so the whole update is replayed as one executable graph. The key
+        # includes each variable's mode because scatter_sub resolves to the
+        # mode-specific fast path at trace time, so a to_static()/to_dynamic()
+        # transition must not reuse a graph traced for the other mode.
+        key = tuple((id(v), v.is_static()) for v in var_list)
+        if key not in self._graph_fns:
+
+            def update_fn(values_list, indices_list):
+                for v, values, indices in zip(var_list, values_list, indices_list):
+                    v.scatter_sub(ops.IndexedSlices(values * self._lr, indices))
+
+            # The nnz of embedding gradients changes every step, so relax the
+            # shapes to one trace per rank instead of one per nnz.
+            try:
+                update_fn = tf.function(update_fn, reduce_retracing=True)
+            except TypeError:
+                update_fn = tf.function(update_fn, experimental_relax_shapes=True)
+
+            self._graph_fns[key] = update_fn
+        return self._graph_fns[key]
+
     def apply_gradients(self, grads_and_vars, global_step=None, name=None):
+        grads_and_vars = [(g, v) for g, v in grads_and_vars if g is not None]
+        if tf.executing_eagerly():
+            if len(grads_and_vars) == 0:
+                return
+            update_fn = self._graph_fn([v for _, v in grads_and_vars])
+            return update_fn(
+                [g.values for g, _ in grads_and_vars], [g.indices for g, _ in grads_and_vars]
+            )
+
         train_ops = []
         for g, v in grads_and_vars:
-            if g is not None:
-                scaled_g = ops.IndexedSlices(g.values * self._lr, g.indices, g.dense_shape)
-                train_ops.append(v.scatter_sub(scaled_g))
+            scaled_g = ops.IndexedSlices(g.values * self._lr, g.indices, g.dense_shape)
+            train_ops.append(v.scatter_sub(scaled_g))
         return tf.group(train_ops)
@@ -8,7 +8,10 @@ python dummy_var_shape_test.py
 python dummy_var_assign_test.py
 python dummy_var_export_test.py
 python dummy_var_sparse_read_test.py
+python dummy_var_sparse_read_cuembed_test.py
+python dummy_var_sparse_read_assign_test.py
 python dummy_var_scatter_add_test.py
+python dummy_var_scatter_sub_test.py
 python dummy_var_scatter_update_test.py
 cd ..
 
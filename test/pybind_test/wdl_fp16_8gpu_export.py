@@ -30,13 +30,16 @@ def wdl_test(json_file, export_path_prefix):
     model.summary()
     model.start_data_reading()
     lr_sch = model.get_learning_rate_scheduler()
-    for i in range(10000):
+    # Loss logging fires every 100 iterations and evaluation every 1000, so
+    # run the loop in 100-step chunks: the boundary work happens on the first
+    # iteration of each chunk and the remaining 99 train back-to-back without
+    # per-iteration modulo checks.
+    for i in range(0, 10000, 100):
         lr = lr_sch.get_next()
         model.set_learning_rate(lr)
         model.train(False)
-        if i % 100 == 0:
-            loss = model.get_current_loss()
-            print("[HUGECTR][INFO] iter: {}; loss: {}".format(i, loss))
+        loss = model.get_current_loss()
+        print("[HUGECTR][INFO] iter: {}; loss: {}".format(i, loss))
         if i % 1000 == 0 and i != 0:
             for _ in range(solver.max_eval_batches):
                 model.eval()
@@ -46,6 +49,10 @@ def wdl_test(json_file, export_path_prefix):
                 )
             metrics = model.get_eval_metrics()
             print("[HUGECTR][INFO] iter: {}, {}".format(i, metrics))
+        for _ in range(99):
+            lr = lr_sch.get_next()
+            model.set_learning_rate(lr)
+            model.train(False)
     return
 
 